@@ -6,6 +6,7 @@ from .export import (
     extract_images,
     generate_markdown,
     normalise_whitespace,
+    parse_article_html,
     render_article,
     write_issue_markdown,
 )
@@ -17,6 +18,7 @@ __all__ = [
     "extract_images",
     "generate_markdown",
     "normalise_whitespace",
+    "parse_article_html",
     "render_article",
     "write_issue_markdown",
     "run_gui",
@@ -0,0 +1,89 @@
+"""本地缓存：用 SQLite 保存已抓取的期刊列表、文章列表与详情，跨会话复用。"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CACHE_PATH = Path.home() / ".china_land_cache.db"
+DEFAULT_TTL = 30 * 24 * 3600  # 秒；已出版期刊的内容基本不变，过期后重新抓取以防站点修订
+MAGAZINES_TTL = 24 * 3600  # 当年的期刊列表会随新刊发布而增加，只缓存一天
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS article_detail (
+    id TEXT PRIMARY KEY,
+    json TEXT NOT NULL,
+    ts INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS magazine_articles (
+    id TEXT PRIMARY KEY,
+    json TEXT NOT NULL,
+    ts INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS year_magazines (
+    id TEXT PRIMARY KEY,
+    json TEXT NOT NULL,
+    ts INTEGER NOT NULL
+);
+"""
+
+
+class ResponseCache:
+    """接口原始返回值的持久化缓存，可在多个线程间共享。"""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, ttl: float | None = DEFAULT_TTL) -> None:
+        self.path = path
+        self.ttl = ttl  # None 表示永不过期
+        # 单个连接在线程间共享，读写都需串行
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock:
+            # WAL 下每次写入只追加日志、不重写主库，逐篇缓存详情时开销更小
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            with self._conn:
+                self._conn.executescript(_SCHEMA)
+
+    def _get(self, table: str, key: str, ttl: float | None = None) -> Any | None:
+        ttl = self.ttl if ttl is None else ttl
+        min_ts = 0 if ttl is None else int(time.time() - ttl)
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT json FROM {table} WHERE id = ? AND ts >= ?", (key, min_ts)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _put(self, table: str, key: str, value: Any) -> None:
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {table} (id, json, ts) VALUES (?, ?, ?)",
+                (key, payload, int(time.time())),
+            )
+
+    def get_article_detail(self, article_id: str) -> dict[str, Any] | None:
+        return self._get("article_detail", article_id)
+
+    def put_article_detail(self, article_id: str, detail: dict[str, Any]) -> None:
+        self._put("article_detail", article_id, detail)
+
+    def get_articles(self, magazine_id: str) -> list[dict[str, Any]] | None:
+        return self._get("magazine_articles", magazine_id)
+
+    def put_articles(self, magazine_id: str, articles: list[dict[str, Any]]) -> None:
+        self._put("magazine_articles", magazine_id, articles)
+
+    def get_magazines(self, year: str) -> list[dict[str, Any]] | None:
+        ttl = MAGAZINES_TTL if self.ttl is None else min(self.ttl, MAGAZINES_TTL)
+        return self._get("year_magazines", year, ttl)
+
+    def put_magazines(self, year: str, magazines: list[dict[str, Any]]) -> None:
+        self._put("year_magazines", year, magazines)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
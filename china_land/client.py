@@ -4,14 +4,27 @@ from __future__ import annotations
 
 import json
 import random
+import threading
 import time
 import uuid
 from typing import Any
+from urllib.robotparser import RobotFileParser
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # 可选依赖：orjson 直接解析响应字节，比 response.json() 更快
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - 未安装时回退到标准库
+    _json_loads = json.loads
 
 BASE_URL = "http://szb.iziran.net"
 COLUMN_ID = 2  # “中国土地”栏目
+MAX_DELAY = 30.0
+THROTTLE_STATUSES = (429, 503)
+DECAY_AFTER = 20  # 连续成功多少次后尝试缩短间隔
+THROTTLE_BACKOFF = 1.0  # 被限流时间隔至少放大到该值，避免间隔为 0 时加倍仍为 0
 
 COMMON_HEADERS = {
     "User-Agent": (
@@ -22,6 +35,7 @@ COMMON_HEADERS = {
     "BROWER_LANGUAGE": "zh-CN",
     "SCREEN": "1080x1920",
     "Accept": "application/json, text/javascript, */*; q=0.01",
+    "Connection": "keep-alive",
     "Origin": BASE_URL,
     "Referer": f"{BASE_URL}/zazhi-pc/html/index.html?cid={COLUMN_ID}",
 }
@@ -32,17 +46,91 @@ class ChinaLandCrawler:
 
     def __init__(self, delay: float = 1.5) -> None:
         self.session = requests.Session()
+        # 导出时多个线程并发请求同一站点：放大连接池以复用 keep-alive 连接，
+        # 并对偶发的 5xx / 429 自动退避重试（查询接口虽为 POST 但幂等）；
+        # 重试用尽后返回最后一次响应而不是抛出 RetryError，以便按状态码调整请求间隔
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        )
+        self.session.mount(BASE_URL, HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry))
         self.session.headers.update(COMMON_HEADERS)
         self.session.headers["myIdentity"] = self._generate_identity()
         self.delay = delay
+        # 自适应间隔：被限流（429/503）时加倍，连续成功后逐步回落到 min_delay
+        self.min_delay = delay
+        self.adaptive_delay = False
+        self._delay_lock = threading.Lock()
+        self._success_streak = 0
+        # 记录每个线程上一次请求的时间，间隔在下一次请求前补足，而不是请求后立即休眠
+        self._pacing = threading.local()
 
     @staticmethod
     def _generate_identity() -> str:
         return f"crawler-{uuid.uuid4()}"
 
     def _respect_delay(self) -> None:
-        sleep_time = max(0.0, self.delay + random.uniform(-0.3, 0.3))
-        time.sleep(sleep_time)
+        last_request = getattr(self._pacing, "last_request", None)
+        if last_request is None:
+            return
+        elapsed = time.monotonic() - last_request
+        sleep_time = self.delay + random.uniform(-0.3, 0.3) - elapsed
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+
+    def set_delay(self, delay: float) -> None:
+        """设置用户指定的请求间隔，同时作为自适应间隔的下限。"""
+        with self._delay_lock:
+            self.min_delay = delay
+            self.delay = delay
+            self._success_streak = 0
+
+    def _adapt_delay(self, response: requests.Response) -> None:
+        if not self.adaptive_delay:
+            return
+        # 适配器内部已重试掉的 429/503 不会出现在最终响应上，只记录在重试历史中
+        retries = getattr(response.raw, "retries", None)
+        history = retries.history if retries is not None else ()
+        with self._delay_lock:
+            for attempt in history:
+                if attempt.status in THROTTLE_STATUSES:
+                    self._back_off(0.0)
+            if response.status_code in THROTTLE_STATUSES:
+                retry_after = response.headers.get("Retry-After", "")
+                self._back_off(float(retry_after) if retry_after.isdigit() else 0.0)
+            elif response.ok:
+                self._success_streak += 1
+                if self._success_streak >= DECAY_AFTER and self.delay > self.min_delay:
+                    self.delay = max(self.min_delay, self.delay * 0.8)
+                    self._success_streak = 0
+
+    def _back_off(self, wait: float) -> None:
+        # 调用方需持有 _delay_lock
+        self.delay = min(MAX_DELAY, max(self.delay * 2, wait, self.min_delay, THROTTLE_BACKOFF))
+        self._success_streak = 0
+
+    def seed_delay_from_robots(self) -> float | None:
+        """读取 robots.txt 中的 Crawl-delay，若比当前下限更大则以其为准；返回读取到的值。"""
+        try:
+            response = self.session.get(f"{BASE_URL}/robots.txt", timeout=10)
+        except requests.RequestException:
+            return None
+        if not response.ok:
+            return None
+        parser = RobotFileParser()
+        parser.parse(response.text.splitlines())
+        crawl_delay = parser.crawl_delay(COMMON_HEADERS["User-Agent"])
+        if crawl_delay is None:
+            return None
+        crawl_delay = float(crawl_delay)
+        with self._delay_lock:
+            if crawl_delay > self.min_delay:
+                self.min_delay = crawl_delay
+                self.delay = max(self.delay, crawl_delay)
+        return crawl_delay
 
     def _request(
         self,
@@ -53,16 +141,20 @@ class ChinaLandCrawler:
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         url = f"{BASE_URL}{path}"
+        self._respect_delay()
         try:
             response = self.session.request(method, url, data=data, params=params, timeout=15)
+            self._adapt_delay(response)
             response.raise_for_status()
-            payload = response.json()
+            payload = _json_loads(response.content)
         except requests.Timeout as exc:
             raise RuntimeError(f"请求超时: {url}") from exc
         except requests.RequestException as exc:
             raise RuntimeError(f"网络错误: {url}") from exc
         except json.JSONDecodeError as exc:
             raise RuntimeError(f"解析 JSON 失败: {url}") from exc
+        finally:
+            self._pacing.last_request = time.monotonic()
 
         if not payload.get("success"):
             message = payload.get("message", "未知错误")
@@ -73,7 +165,6 @@ class ChinaLandCrawler:
     def login(self) -> None:
         params = {"rd": int(time.time() * 1000)}
         self._request("GET", "/user/ipLogin", params=params)
-        self._respect_delay()
 
     # --- 数据接口 -----------------------------------------------------
     def fetch_years(self) -> list[str]:
@@ -90,7 +181,6 @@ class ChinaLandCrawler:
         magazines = payload.get("data", [])
         if not isinstance(magazines, list):
             raise RuntimeError("期刊接口返回格式不正确")
-        self._respect_delay()
         return magazines
 
     def fetch_articles(self, magazine_id: str) -> list[dict[str, Any]]:
@@ -99,7 +189,6 @@ class ChinaLandCrawler:
         articles = payload.get("data", [])
         if not isinstance(articles, list):
             raise RuntimeError("文章列表接口返回格式不正确")
-        self._respect_delay()
         return articles
 
     def fetch_article_detail(self, article_id: str) -> dict[str, Any]:
@@ -108,6 +197,5 @@ class ChinaLandCrawler:
         article = payload.get("data")
         if not isinstance(article, dict):
             raise RuntimeError("文章详情接口返回格式不正确")
-        self._respect_delay()
         return article
 
@@ -4,80 +4,170 @@ from __future__ import annotations
 
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from html import unescape
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from collections import defaultdict
 
+try:  # 可选依赖：orjson 解析 JSONL 明显快于标准库
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - 未安装时回退到标准库
+    _json_loads = json.loads
+
 BASE_DATA_URL = "http://szb.iziran.net/dataFile"
+# 同一篇文章会在渲染、预览和多种导出模式中反复清洗，按输入字符串缓存结果；
+# 缓存的是整篇正文，容量只覆盖最近浏览与单期导出，全量导出时不会随规模增长
+_CACHE_SIZE = 256
+_WRITE_BUFFER = 1 << 20
+
+_P_BLANKS = re.compile(r"\n{3,}")
+# 命中任一字符才可能需要完整清洗：标签、实体、"\">"、图片路径以及 splitlines 识别的各类换行
+_P_NEEDS_CLEAN = re.compile("[<>&/\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+# 按替换文本归并标签规则，每个模式都以字面量 "<" 开头，保留正则引擎的前缀快速扫描。
+_P_NEWLINE_TAGS = re.compile(r"<(?:(?-i:br(?: ?/)?)|/li\s*)>", re.IGNORECASE)
+_P_CLOSE_P = re.compile(r"</p\s*>", re.IGNORECASE)
+_P_LI = re.compile(r"<li\b[^>]*>", re.IGNORECASE)
+# 注释整体移除（其中可能含有 ">"），</script > 这类带空白的闭合标签也一并识别；
+# 带引号 src 的 <img> 整体匹配（src 中只允许 <%basePath%> 这类模板占位含有 "<"、">"，
+# 引号未闭合时不会越过本标签吞掉后文，而是落到通用分支），并在同一次匹配中
+# 用前瞻取出 src 之前或之后的 alt，split 一次即可同时得到正文片段与图片信息；
+# 通用标签不跨越 "<"，正文中孤立的 "<"（如 "x<3"）不会吞掉其后的 <style>、换行与图片
+_P_STRIP_TAGS = re.compile(
+    r"<(?:!--.*?-->|(script|style)\b.*?>.*?</\1\s*>"
+    r"|img\b(?:(?=[^>]*?alt=[\"']([^\"'<>]*)[\"']))?[^>]*src=[\"']((?:<%\w+%>|[^\"'<>])+)[\"']"
+    r"(?:(?=[^>]*?alt=[\"']([^\"'<>]*)[\"']))?[^>]*>"
+    r"|[^<>]+>)",
+    re.IGNORECASE | re.DOTALL,
+)
+_P_BATCH = re.compile(r"/batch/[\w\-/\.%]+")
+_P_IMAGES = re.compile(r"images/[\w\-/\.%]+")
+_P_SAFE_PAGE = re.compile(r"[^0-9A-Za-z\u4e00-\u9fff\-（）()第期年月日]")
+_P_SAFE_NAME = re.compile(r"[^0-9A-Za-z\u4e00-\u9fff\-（）()第期年月日 ]")
+_P_SAFE_YEAR = re.compile(r"[^0-9A-Za-z]")
 
 
 def normalise_whitespace(value: str) -> str:
-    text = clean_html(value)
-    return re.sub(r"\n{3,}", "\n\n", text)
+    return _collapse_blank_lines(clean_html(value))
+
+
+def _collapse_blank_lines(text: str) -> str:
+    # clean_html 已把连续空行压成一个，通常不会出现三连换行，子串判断即可跳过正则
+    if "\n\n\n" not in text:
+        return text
+    return _P_BLANKS.sub("\n\n", text)
 
 
 def clean_html(text: Optional[str]) -> str:
     if not text:
         return ""
-    value = text
-    replacements = {
-        "<br>": "\n",
-        "<br/>": "\n",
-        "<br />": "\n",
-    }
-    for key, val in replacements.items():
-        value = value.replace(key, val)
-    value = re.sub(r"</p\s*>", "\n\n", value, flags=re.IGNORECASE)
-    value = re.sub(r"<p\b[^>]*>", "", value, flags=re.IGNORECASE)
-    value = re.sub(r"<li\b[^>]*>", "- ", value, flags=re.IGNORECASE)
-    value = re.sub(r"</li\s*>", "\n", value, flags=re.IGNORECASE)
-    value = re.sub(r"<(script|style)\b.*?>.*?</\1>", "", value, flags=re.IGNORECASE | re.DOTALL)
-    value = re.sub(r"<img\b[^>]*>", "", value, flags=re.IGNORECASE)
-    value = re.sub(r"<[^>]+>", "", value)
-    value = value.replace("<%basePath%>", "")
-    value = re.sub(r"/batch/[\w\-/\.%]+", "", value)
-    value = re.sub(r"images/[\w\-/\.%]+", "", value)
-    value = value.replace('">', "")
-    value = unescape(value)
-    lines = [line.strip(" \t\u3000") for line in value.splitlines()]
-    cleaned_lines = []
-    for line in lines:
-        if not line:
-            if cleaned_lines and cleaned_lines[-1] != "":
-                cleaned_lines.append("")
-            continue
-        cleaned_lines.append(line)
-    return "\n".join(cleaned_lines).strip()
+    # 标题、作者、栏目等短字段大多是纯文本，无需走正则流水线，也不必占用缓存
+    if not _P_NEEDS_CLEAN.search(text):
+        return text.strip()
+    return _parse_html(text)[0]
 
 
 def extract_images(html: str | None) -> list[Dict[str, str]]:
-    if not html:
+    if not html or "<" not in html:
         return []
-    images: List[Dict[str, str]] = []
-    for match in re.finditer(r'<img\b[^>]*src=["\']([^"\']+)["\'][^>]*>', html, flags=re.IGNORECASE):
-        src = match.group(1)
+    return [{"url": url, "alt": alt} for url, alt in _parse_html(html)[1]]
+
+
+def parse_article_html(html: str | None) -> tuple[str, list[Dict[str, str]]]:
+    """一次扫描同时返回清洗后的正文与图片列表，等价于 (clean_html, extract_images)。"""
+    if not html:
+        return "", []
+    if not _P_NEEDS_CLEAN.search(html):
+        return html.strip(), []
+    text, pairs = _parse_html(html)
+    return text, [{"url": url, "alt": alt} for url, alt in pairs]
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_html(text: str) -> tuple[str, tuple[tuple[str, str], ...]]:
+    value = _P_NEWLINE_TAGS.sub("\n", text)
+    value = _P_CLOSE_P.sub("\n\n", value)
+    value = _P_LI.sub("- ", value)
+    # 同时去除 <p>、<img>、<%basePath%> 等其余标签；split 结果按 (正文, script/style, 前置 alt, src, 后置 alt) 五项循环
+    parts = _P_STRIP_TAGS.split(value)
+    images: List[tuple[str, str]] = []
+    for alt_before, src, alt_after in zip(parts[2::5], parts[3::5], parts[4::5]):
+        if src is None:
+            continue
         src = src.replace("<%basePath%>", BASE_DATA_URL)
-        alt_match = re.search(r'alt=["\']([^"\']*)["\']', match.group(0), flags=re.IGNORECASE)
-        alt_text = unescape(alt_match.group(1)) if alt_match else ""
-        images.append({"url": src.strip(), "alt": alt_text.strip()})
-    return images
+        alt = alt_before if alt_before is not None else alt_after
+        alt_text = unescape(alt) if alt else ""
+        images.append((src.strip(), alt_text.strip()))
+    value = "".join(parts[::5])
+    value = _P_BATCH.sub("", value)
+    value = _P_IMAGES.sub("", value)
+    value = value.replace('">', "")
+    value = unescape(value)
+    cleaned_lines: List[str] = []
+    append = cleaned_lines.append
+    blank = True  # 开头的空行直接丢弃，连续空行只保留一个
+    for line in value.splitlines():
+        line = line.strip(" \t\u3000")
+        if line:
+            append(line)
+            blank = False
+        elif not blank:
+            append("")
+            blank = True
+    return "\n".join(cleaned_lines).strip(), tuple(images)
 
 
-def render_article(article: Dict[str, Any]) -> str:
+def article_sort_key(article: Dict[str, Any]) -> int:
+    """文章排序键：按数值 index 排序，缺失或无法解析时视为 0。"""
     index_raw = article.get("index")
+    if type(index_raw) is int:
+        return index_raw
+    try:
+        return int(index_raw or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def render_article(article: Dict[str, Any]) -> str:
+    fields = (
+        article.get("index"),
+        article.get("titleHtml") or article.get("title") or "",
+        article.get("authorHtml") or article.get("author") or "",
+        article.get("column") or "",
+        article.get("pageNumber"),
+        article.get("html") or "",
+        article.get("text") or "",
+    )
+    # 单期、全年、全量导出会重复渲染同一篇文章，按字段内容缓存渲染结果
+    try:
+        hash(fields)
+    except TypeError:  # 字段含不可哈希的值时不走缓存
+        return _render_fields.__wrapped__(*fields)
+    return _render_fields(*fields)
+
+
+@lru_cache(maxsize=_CACHE_SIZE, typed=True)
+def _render_fields(
+    index_raw: Any,
+    title_html: str,
+    author_html: str,
+    column_html: str,
+    page_number: Any,
+    body_html: str,
+    body_fallback: str,
+) -> str:
     try:
         index_str = f"{int(index_raw):03d}"
     except (TypeError, ValueError):
         index_str = str(index_raw)
-    title = normalise_whitespace(article.get("titleHtml") or article.get("title") or "")
-    author = normalise_whitespace(article.get("authorHtml") or article.get("author") or "")
-    column = normalise_whitespace(article.get("column") or "")
-    page_number = article.get("pageNumber")
-    body_html = article.get("html") or ""
-    body_text = normalise_whitespace(body_html)
+    title = normalise_whitespace(title_html)
+    author = normalise_whitespace(author_html)
+    column = normalise_whitespace(column_html)
+    body_text, images = parse_article_html(body_html)
+    body_text = _collapse_blank_lines(body_text)
     if not body_text:
-        body_text = normalise_whitespace(article.get("text") or "")
+        body_text = normalise_whitespace(body_fallback)
     lines: List[str] = []
     lines.append(f"## {index_str} {title}")
     meta_lines = []
@@ -91,7 +181,6 @@ def render_article(article: Dict[str, Any]) -> str:
         for meta in meta_lines:
             lines.append(f"- {meta}")
         lines.append("")
-    images = extract_images(article.get("html"))
     if images:
         for idx, image in enumerate(images, start=1):
             caption = image["alt"] or f"图片{idx}"
@@ -101,6 +190,46 @@ def render_article(article: Dict[str, Any]) -> str:
     return "\n".join(lines).strip()
 
 
+def _write_markdown(output_path: Path, chunks: Iterable[str]) -> None:
+    """流式写出 Markdown，结果与 ``"\\n".join(chunks).strip() + "\\n"`` 一致。
+
+    先写入同目录下的 .part 文件，全部写完再替换目标；chunks 中途抛出异常（例如导出被取消）
+    时删除临时文件，不会留下看似完整的半截文件。
+    """
+    partial = output_path.with_name(output_path.name + ".part")
+    try:
+        with partial.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as file:
+            started = False
+            pending = ""  # 暂缓写出的空白，若位于文末则整体丢弃
+            for index, chunk in enumerate(chunks):
+                text = f"\n{chunk}" if index else chunk
+                if not started:
+                    text = text.lstrip()
+                    if not text:
+                        continue
+                    started = True
+                body = text.rstrip()
+                if body:
+                    file.write(pending)
+                    file.write(body)
+                    pending = text[len(body):]
+                else:
+                    pending += text
+            file.write("\n")
+        partial.replace(output_path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+
+def _magazine_section(magazine: Dict[str, Any], articles: List[Dict[str, Any]]) -> Iterator[str]:
+    yield f"\n## {normalise_whitespace(magazine.get('title') or '')} ({magazine.get('date', '')})"
+    for position, article in enumerate(articles):
+        if position:
+            yield "---"
+        yield render_article(article)
+
+
 def write_issue_markdown(
     magazine_meta: Dict[str, Any],
     articles: List[Dict[str, Any]],
@@ -114,23 +243,24 @@ def write_issue_markdown(
     date = magazine_meta.get("date") or ""
     full_title = normalise_whitespace(magazine_meta.get("title") or "")
     header_title = full_title or f"{prefix}{year}{page_name}"
-    safe_page = re.sub(r"[^0-9A-Za-z\u4e00-\u9fff\-（）()第期年月日]", "_", page_name)
+    safe_page = _P_SAFE_PAGE.sub("_", page_name)
     identifier = fallback_name or magazine_meta.get("id") or "magazine"
     filename = f"{year}_{safe_page or identifier}.md"
     output_path = output_dir / filename
-    lines: List[str] = []
-    lines.append(f"# {header_title.strip()}")
-    if date:
-        lines.append("")
-        lines.append(f"- 出版日期：{date}")
-    for article in articles:
-        lines.append("")
-        lines.append(render_article(article))
-        lines.append("")
-        lines.append("---")
-    if lines and lines[-1] == "---":
-        lines.pop()
-    output_path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+
+    def chunks() -> Iterator[str]:
+        yield f"# {header_title.strip()}"
+        if date:
+            yield ""
+            yield f"- 出版日期：{date}"
+        for position, article in enumerate(articles):
+            if position:
+                yield ""
+                yield "---"
+            yield ""
+            yield render_article(article)
+
+    _write_markdown(output_path, chunks())
     return output_path
 
 
@@ -148,7 +278,7 @@ def write_article_separately(
     except (TypeError, ValueError):
         index_str = str(index_raw)
     title = normalise_whitespace(article.get("title") or "")
-    safe_name = re.sub(r"[^0-9A-Za-z\u4e00-\u9fff\-（）()第期年月日 ]", "_", f"{year}_{page_name}_{index_str}_{title}".strip())
+    safe_name = _P_SAFE_NAME.sub("_", f"{year}_{page_name}_{index_str}_{title}".strip())
     filename = f"{prefix}_{safe_name}.md"
     output_path = output_dir / filename
     content = render_article(article)
@@ -177,26 +307,23 @@ def write_year_markdown(
     prefix: str,
 ) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
-    lines: List[str] = [f"# {prefix} {year} 全年文章"]
     # Group articles by magazine
     articles_by_mag: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     for article in all_articles:
         mag_id = article.get("magazine_id")
         if mag_id:
             articles_by_mag[mag_id].append(article)
-    for mag in sorted(magazines, key=lambda m: m.get("date", "")):
-        mag_lines = [f"\n## {normalise_whitespace(mag.get('title') or '')} ({mag.get('date', '')})"]
-        mag_articles = sorted(articles_by_mag.get(mag["id"], []), key=lambda x: x.get("index") or 0)
-        for article in mag_articles:
-            mag_lines.append(render_article(article))
-            mag_lines.append("---")
-        if mag_lines and mag_lines[-1] == "---":
-            mag_lines.pop()
-        lines.extend(mag_lines)
-    safe_year = re.sub(r"[^0-9A-Za-z]", "_", year)
+
+    def chunks() -> Iterator[str]:
+        yield f"# {prefix} {year} 全年文章"
+        for mag in sorted(magazines, key=lambda m: m.get("date", "")):
+            mag_articles = sorted(articles_by_mag.get(mag["id"], []), key=article_sort_key)
+            yield from _magazine_section(mag, mag_articles)
+
+    safe_year = _P_SAFE_YEAR.sub("_", year)
     filename = f"{prefix}_{safe_year}_full.md"
     output_path = output_dir / filename
-    output_path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+    _write_markdown(output_path, chunks())
     return output_path
 
 
@@ -207,43 +334,79 @@ def write_all_markdown(
     output_dir: Path,
     prefix: str,
 ) -> Path:
-    output_dir.mkdir(parents=True, exist_ok=True)
-    lines: List[str] = [f"# {prefix} 全量文章"]
-    # Group by year then magazine
-    articles_by_year_mag: Dict[str, Dict[str, List[Dict[str, Any]]]] = defaultdict(lambda: defaultdict(list))
+    # Group by year; magazine grouping happens per year section
+    articles_by_year: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     for article in all_articles:
         year = article.get("year")
-        mag_id = article.get("magazine_id")
-        if year and mag_id:
-            articles_by_year_mag[year][mag_id].append(article)
-    for year in years:
-        year_lines = [f"\n# {year} 年"]
-        mags = [m for y, ms in year_magazines if y == year for m in ms]
-        for mag in sorted(mags, key=lambda m: m.get("date", "")):
-            mag_lines = [f"\n## {normalise_whitespace(mag.get('title') or '')} ({mag.get('date', '')})"]
-            mag_articles = sorted(articles_by_year_mag[year].get(mag["id"], []), key=lambda x: x.get("index") or 0)
-            for article in mag_articles:
-                mag_lines.append(render_article(article))
-                mag_lines.append("---")
-            if mag_lines and mag_lines[-1] == "---":
-                mag_lines.pop()
-            year_lines.extend(mag_lines)
-        lines.extend(year_lines)
+        if year and article.get("magazine_id"):
+            articles_by_year[year].append(article)
+
+    # 每年的期刊列表只归并一次，避免逐年重新扫描 year_magazines
+    mags_by_year: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for y, ms in year_magazines:
+        mags_by_year[y].extend(ms)
+
+    sections = ((year, mags_by_year.get(year, []), articles_by_year.get(year, [])) for year in years)
+    return write_all_markdown_sections(sections, output_dir, prefix)
+
+
+def write_all_markdown_sections(
+    sections: Iterable[tuple[str, List[Dict[str, Any]], List[Dict[str, Any]]]],
+    output_dir: Path,
+    prefix: str,
+) -> Path:
+    """按年份逐段写出全量 Markdown。
+
+    sections 依次给出 (年份, 该年期刊, 该年文章)，可以是生成器：写完一年即可释放该年的文章。
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    def chunks() -> Iterator[str]:
+        yield f"# {prefix} 全量文章"
+        for year, magazines, articles in sections:
+            yield f"\n# {year} 年"
+            articles_by_mag: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            for article in articles:
+                mag_id = article.get("magazine_id")
+                if mag_id:
+                    articles_by_mag[mag_id].append(article)
+            for mag in sorted(magazines, key=lambda m: m.get("date", "")):
+                mag_articles = sorted(articles_by_mag.get(mag["id"], []), key=article_sort_key)
+                yield from _magazine_section(mag, mag_articles)
+
     filename = f"{prefix}_all_full.md"
     output_path = output_dir / filename
-    output_path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+    _write_markdown(output_path, chunks())
     return output_path
 
 
-def generate_markdown(input_path: Path, output_dir: Path, prefix: str) -> List[Path]:
+def _render_issue(job: tuple[Dict[str, Any], List[Dict[str, Any]], Path, str]) -> Path:
+    # 顶层函数，供进程池按名称序列化调用
+    meta, articles, output_dir, prefix = job
+    return write_issue_markdown(meta, articles, output_dir, prefix)
+
+
+def generate_markdown(
+    input_path: Path,
+    output_dir: Path,
+    prefix: str,
+    max_workers: int | None = None,
+) -> List[Path]:
+    """把 JSONL 记录按期渲染为 Markdown。
+
+    默认在当前进程中渲染；max_workers > 1 时改用进程池。Windows / macOS 以 spawn
+    方式启动子进程，此时调用方脚本必须把入口放在 ``if __name__ == "__main__":`` 之下，
+    否则进程池会因子进程重新执行脚本而报 BrokenProcessPool。
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
     magazines: Dict[str, Dict[str, Any]] = {}
-    articles_by_mag: Dict[str, List[Dict[str, Any]]] = {}
-    with input_path.open(encoding="utf-8") as file:
+    articles_by_mag: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    # 以二进制读取，orjson 可直接解析 UTF-8 字节，标准库 json.loads 同样接受 bytes
+    with input_path.open("rb") as file:
         for line in file:
             if not line.strip():
                 continue
-            record = json.loads(line)
+            record = _json_loads(line)
             magazine = record["magazine"]
             magazine_id = magazine["id"]
             if magazine_id not in magazines:
@@ -254,10 +417,15 @@ def generate_markdown(input_path: Path, output_dir: Path, prefix: str) -> List[P
                     "date": magazine.get("date"),
                     "title": magazine.get("title") or magazine.get("subject") or "",
                 }
-            articles_by_mag.setdefault(magazine_id, []).append(record["article"])
-    output_files: List[Path] = []
-    for magazine_id, meta in magazines.items():
-        articles = sorted(articles_by_mag.get(magazine_id, []), key=lambda x: x.get("index") or 0)
-        output_files.append(write_issue_markdown(meta, articles, output_dir, prefix))
-    return output_files
+            articles_by_mag[magazine_id].append(record["article"])
+    jobs = [
+        (meta, sorted(articles_by_mag[magazine_id], key=article_sort_key), output_dir, prefix)
+        for magazine_id, meta in magazines.items()
+    ]
+    # 各期互不依赖且以正则清洗为主（CPU 密集），显式要求多个进程时交给进程池绕开 GIL；
+    # 仅一期时直接在当前进程渲染，省去进程启动与序列化开销
+    if len(jobs) <= 1 or max_workers is None or max_workers <= 1:
+        return [_render_issue(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_render_issue, jobs))
 
@@ -2,27 +2,55 @@
 
 from __future__ import annotations
 
+import atexit
 import concurrent.futures
+import queue
+import sqlite3
 import threading
 import time
 import tkinter as tk
 from collections import defaultdict
 from pathlib import Path
 from tkinter import filedialog, messagebox, scrolledtext, ttk
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
+from .cache import DEFAULT_CACHE_PATH, ResponseCache
 from .client import ChinaLandCrawler
 from .export import (
-    extract_images,
+    article_sort_key,
     normalise_whitespace,
+    parse_article_html,
     render_article,
-    write_all_markdown,
+    write_all_markdown_sections,
     write_article_separately,
     write_issue_markdown,
     write_year_markdown,
 )
 
 
+DEFAULT_IO_WORKERS = 3
+PROGRESS_DRAIN_MS = 100
+LOG_DRAIN_MS = 150
+LOG_BATCH = 200
+LOG_MAX_LINES = 2000
+DELAY_REFRESH_MS = 500
+EXPORT_INFLIGHT_PER_WORKER = 4  # 导出时每个线程最多预先排队的详情请求数
+# 详情接口可能缺失、需从文章列表补齐的字段；详情中已有的值优先
+_ENRICH_KEYS = ("title", "titleHtml", "author", "authorHtml", "column", "text", "pageNumber", "coverImgPath")
+_ENRICH_KEYS_SHORT = _ENRICH_KEYS[:-1]
+
+
+def _enrich_detail(detail: dict[str, Any], base: dict[str, Any], keys: Tuple[str, ...]) -> dict[str, Any]:
+    enriched = {key: base[key] for key in keys if key in base}
+    enriched["index"] = base.get("index")
+    enriched.update(detail)
+    return enriched
+
+
+class _ExportCancelled(Exception):
+    """在流式写出过程中取消导出，用于中止写出并丢弃未完成的文件。"""
+
+
 class ChinaLandGUI(tk.Tk):
     """主界面。"""
 
@@ -34,20 +62,50 @@ class ChinaLandGUI(tk.Tk):
         self.crawler: ChinaLandCrawler | None = None
         self.current_year: str | None = None
         self.current_magazine_id: str | None = None
+        self._issue_id_by_label: dict[str, str] = {}
         self.magazines_by_year: dict[str, list[dict[str, Any]]] = defaultdict(list)
         self.articles_by_mag: dict[str, list[dict[str, Any]]] = defaultdict(list)
         self.article_details: dict[str, dict[str, Any]] = {}
+        self._article_index: dict[str, dict[str, Any]] = {}  # 文章 id -> 列表中的文章元数据
+        self._article_rows: dict[str, list[str]] = {}  # 期刊 id -> 文章列表框各行文本
+        self._displayed_magazine_id: str | None = None  # 文章列表框当前展示的期刊
+        self._listbox_ids: list[str] = []  # 与文章列表框各行一一对应的文章 id
+        self._inflight: dict[str, concurrent.futures.Future[dict[str, Any]]] = {}  # 正在抓取的文章详情
+        self._inflight_lock = threading.Lock()
+        self._prefetch_stop = threading.Event()  # 置位即停止当前期刊的后台预取
         self.progress_total = 1
         self.progress_current = 0
         self.progress_text = ""
+        # 导出线程只累加进度，由主线程定时合并刷新，避免每篇文章都向 Tk 投递一次事件
+        self._progress_lock = threading.Lock()
+        self._progress_pending = 0
+        self._progress_pending_total = 0
+        self._progress_pending_text: str | None = None
+        self._progress_tick_id: str | None = None
+        # 日志可能来自工作线程，先入队，再由主线程批量写入文本框
+        self._log_queue: queue.SimpleQueue[str] = queue.SimpleQueue()
         self.export_mode_var = tk.StringVar(value="按期 (每期MD)")
         self.is_exporting = False
         self.pause_event: threading.Event | None = None
-        self.cancel_flag = False
+        self._cancel_event = threading.Event()
         self.pause_button: tk.Button | None = None
         self.cancel_button: tk.Button | None = None
+        # 导出时抓取文章详情的线程池常驻复用，避免每次导出、每期期刊重建线程
+        self._io_pool_size = DEFAULT_IO_WORKERS
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._io_pool_size, thread_name_prefix="cl-io"
+        )
+        # 关闭窗口时即撤销排队中的请求；不能放在 atexit 中，concurrent.futures 自己的退出钩子
+        # 会先一步等待所有排队任务执行完毕
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self._build_widgets()
+        self._cache: ResponseCache | None = None
+        try:
+            self._cache = ResponseCache(DEFAULT_CACHE_PATH)
+            atexit.register(self._cache.close)
+        except sqlite3.Error as exc:
+            self.log(f"本地缓存不可用，将直接从网络获取：{exc}")
 
     def _build_widgets(self) -> None:
         padding = {"padx": 10, "pady": 5}
@@ -58,6 +116,13 @@ class ChinaLandGUI(tk.Tk):
         tk.Label(frame_controls, text="  请求间隔（秒）：").pack(side=tk.LEFT)
         self.delay_var = tk.DoubleVar(value=1.5)
         tk.Entry(frame_controls, width=5, textvariable=self.delay_var).pack(side=tk.LEFT)
+        self.adaptive_delay_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(frame_controls, text="自适应间隔", variable=self.adaptive_delay_var).pack(side=tk.LEFT)
+        self.current_delay_var = tk.StringVar(value="")
+        tk.Label(frame_controls, textvariable=self.current_delay_var).pack(side=tk.LEFT)
+        tk.Label(frame_controls, text="  并发线程：").pack(side=tk.LEFT)
+        self.workers_var = tk.IntVar(value=DEFAULT_IO_WORKERS)
+        tk.Entry(frame_controls, width=4, textvariable=self.workers_var).pack(side=tk.LEFT)
 
         frame_select = tk.Frame(self)
         frame_select.pack(fill=tk.X, **padding)
@@ -140,6 +205,8 @@ class ChinaLandGUI(tk.Tk):
         self.log_widget = scrolledtext.ScrolledText(frame_log, width=80, height=10, state=tk.DISABLED)
         self.log_widget.pack(fill=tk.BOTH, expand=True)
         self.reset_progress()
+        self.after(LOG_DRAIN_MS, self._drain_log)
+        self.after(DELAY_REFRESH_MS, self._refresh_delay_display)
 
     def disable_export_controls(self, disable: bool) -> None:
         state = "disabled" if disable else "normal"
@@ -177,13 +244,40 @@ class ChinaLandGUI(tk.Tk):
             self.log("导出已恢复")
 
     def cancel_export(self) -> None:
-        self.cancel_flag = True
+        self._cancel_event.set()
         if self.pause_event:
             self.pause_event.set()  # Resume to check cancel
         self.log("导出取消中...")
-        self.after(1000, self._finish_cancel)
+        self.after(1000, self._finish_cancel, self._cancel_event)
+
+    def _refresh_io_pool(self) -> None:
+        """按界面设置的并发线程数调整共享线程池，数量不变时直接复用。"""
+        try:
+            workers = max(1, int(self.workers_var.get()))
+        except (tk.TclError, ValueError):
+            workers = DEFAULT_IO_WORKERS
+        if workers == self._io_pool_size:
+            return
+        self._io_pool.shutdown(wait=False)
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cl-io")
+        self._io_pool_size = workers
+
+    def _shutdown_io_pool(self) -> None:
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _on_close(self) -> None:
+        # 让导出与预取线程尽快停下，暂停中的导出也需放行才能看到取消
+        self._cancel_event.set()
+        self._prefetch_stop.set()
+        if self.pause_event:
+            self.pause_event.set()
+        self._shutdown_io_pool()
+        self.destroy()
 
-    def _finish_cancel(self) -> None:
+    def _finish_cancel(self, cancel_event: threading.Event) -> None:
+        # 兜底定时器与工作线程都会调用，只处理当前这次导出的第一次调用
+        if cancel_event is not self._cancel_event or not self.is_exporting:
+            return
         self.is_exporting = False
         self.disable_export_controls(False)
         self.finish_progress("导出已取消")
@@ -193,10 +287,31 @@ class ChinaLandGUI(tk.Tk):
     # region log helpers
     def log(self, message: str) -> None:
         timestamp = time.strftime("%H:%M:%S")
-        self.log_widget.configure(state=tk.NORMAL)
-        self.log_widget.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_widget.see(tk.END)
-        self.log_widget.configure(state=tk.DISABLED)
+        self._log_queue.put(f"[{timestamp}] {message}\n")
+
+    def _drain_log(self) -> None:
+        lines: List[str] = []
+        try:
+            while len(lines) < LOG_BATCH:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self.log_widget.configure(state=tk.NORMAL)
+            self.log_widget.insert(tk.END, "".join(lines))
+            # 只保留最近的日志，避免文本框无限增长
+            self.log_widget.delete("1.0", f"end-{LOG_MAX_LINES}l")
+            self.log_widget.see(tk.END)
+            self.log_widget.configure(state=tk.DISABLED)
+        self.after(LOG_DRAIN_MS, self._drain_log)
+
+    def _refresh_delay_display(self) -> None:
+        # 自适应间隔会在后台调整，定时显示爬虫当前实际使用的间隔
+        if self.crawler is not None and self.crawler.adaptive_delay:
+            self.current_delay_var.set(f"（当前 {self.crawler.delay:.1f} 秒）")
+        else:
+            self.current_delay_var.set("")
+        self.after(DELAY_REFRESH_MS, self._refresh_delay_display)
 
     def reset_progress(self) -> None:
         self.progress_total = 1
@@ -207,14 +322,15 @@ class ChinaLandGUI(tk.Tk):
         self.progress_var.set(0)
 
     def start_progress(self, total: int, text: str) -> None:
-        total = max(total, 1)
+        # total 为 0 表示总数尚未知晓，随后由 extend_progress_total 逐步累加
         self.progress_total = total
         self.progress_current = 0
         self.progress_text = text
-        self.progress_bar["maximum"] = total
+        self.progress_bar["maximum"] = max(total, 1)
         self.progress_var.set(0)
         self.progress_label_var.set(f"{text} (0/{total})")
         self.progress_bar.update_idletasks()
+        self._ensure_progress_drain()
 
     def update_progress(self, step: int = 1, text: str | None = None) -> None:
         if self.progress_total <= 0:
@@ -225,12 +341,55 @@ class ChinaLandGUI(tk.Tk):
         self.progress_var.set(self.progress_current)
         self.progress_bar.update_idletasks()
 
+    def extend_progress_total(self, count: int) -> None:
+        self.progress_total += count
+        self.progress_bar["maximum"] = max(self.progress_total, 1)
+        self.progress_label_var.set(f"{self.progress_text} ({self.progress_current}/{self.progress_total})")
+
+    def _queue_progress_total(self, count: int) -> None:
+        """供工作线程调用：边枚举边增加进度总数，省去预先统计的一轮遍历。"""
+        with self._progress_lock:
+            self._progress_pending_total += count
+
+    def _queue_progress(self, step: int = 1, text: str | None = None) -> None:
+        """供工作线程调用：累加进度，实际刷新交给 _drain_progress。"""
+        with self._progress_lock:
+            self._progress_pending += step
+            if text:
+                self._progress_pending_text = text
+
+    def _ensure_progress_drain(self) -> None:
+        if self._progress_tick_id is None:
+            self._progress_tick_id = self.after(PROGRESS_DRAIN_MS, self._drain_progress)
+
+    def _drain_progress(self) -> None:
+        with self._progress_lock:
+            step, text = self._progress_pending, self._progress_pending_text
+            total = self._progress_pending_total
+            self._progress_pending = 0
+            self._progress_pending_total = 0
+        if total:
+            self.extend_progress_total(total)
+        if step:
+            self.update_progress(step, text)
+        self._progress_tick_id = self.after(PROGRESS_DRAIN_MS, self._drain_progress)
+
+    def _discard_pending_progress(self) -> None:
+        if self._progress_tick_id is not None:
+            self.after_cancel(self._progress_tick_id)
+            self._progress_tick_id = None
+        with self._progress_lock:
+            self._progress_pending = 0
+            self._progress_pending_total = 0
+            self._progress_pending_text = None
+
     def finish_progress(self, text: str | None = None) -> None:
+        self._discard_pending_progress()
         if text:
             self.progress_label_var.set(text)
         else:
             self.progress_label_var.set(f"{self.progress_text} 完成")
-        self.progress_var.set(self.progress_total)
+        self.progress_var.set(max(self.progress_total, 1))
         self.progress_bar.update_idletasks()
         self.after(1500, self.reset_progress)
 
@@ -240,12 +399,18 @@ class ChinaLandGUI(tk.Tk):
         if self.crawler is None:
             self.crawler = ChinaLandCrawler(delay=self.delay_var.get())
         else:
-            self.crawler.delay = self.delay_var.get()
+            self.crawler.set_delay(self.delay_var.get())
+        adaptive = self.adaptive_delay_var.get()
+        self.crawler.adaptive_delay = adaptive
         self.log("开始登录并加载年份……")
         self.set_loading(True)
 
         def worker() -> None:
             try:
+                if adaptive:
+                    crawl_delay = self.crawler.seed_delay_from_robots()
+                    if crawl_delay is not None:
+                        self.log(f"robots.txt 要求的抓取间隔：{crawl_delay} 秒")
                 self.crawler.login()
                 years = self.crawler.fetch_years()
             except Exception as exc:  # pylint: disable=broad-except
@@ -267,14 +432,15 @@ class ChinaLandGUI(tk.Tk):
         self.set_loading(False)
         self.magazines_by_year.clear()
         self.articles_by_mag.clear()
+        self._article_index.clear()
+        self._article_rows.clear()
         self.article_details.clear()
-        self.year_combo.configure(state="readonly")
-        self.year_combo["values"] = years
+        self.year_combo.configure(state="readonly", values=years)
         self.year_var.set("")
         self.issue_combo.set("")
-        self.issue_combo["values"] = []
-        self.issue_combo.configure(state=tk.DISABLED)
-        self.article_list.delete(0, tk.END)
+        self._issue_id_by_label.clear()
+        self.issue_combo.configure(state=tk.DISABLED, values=[])
+        self._clear_article_list()
         self.clear_content()
         self.log(f"登录成功，获取到 {len(years)} 个年份。")
 
@@ -284,6 +450,9 @@ class ChinaLandGUI(tk.Tk):
         year = self.year_var.get()
         if not year:
             return
+        # 重新选中已展示的年份：下拉框与列表都是最新的，避免清空重建造成闪烁
+        if year == self.current_year and self._issue_id_by_label:
+            return
         self.current_year = year
         if year in self.magazines_by_year:
             magazines = self.magazines_by_year[year]
@@ -291,13 +460,14 @@ class ChinaLandGUI(tk.Tk):
             return
 
         self.log(f"加载 {year} 年期刊列表……")
+        self._issue_id_by_label.clear()
         self.issue_combo.configure(state=tk.DISABLED)
-        self.article_list.delete(0, tk.END)
+        self._clear_article_list()
         self.clear_content()
 
         def worker() -> None:
             try:
-                magazines = self.crawler.fetch_magazines(year)  # type: ignore[union-attr]
+                magazines = self._fetch_magazines(year)
             except Exception as exc:  # pylint: disable=broad-except
                 self.after(0, self.on_year_failed, exc)
                 return
@@ -316,41 +486,47 @@ class ChinaLandGUI(tk.Tk):
     def populate_issues(self, magazines: list[dict[str, Any]]) -> None:
         if not magazines:
             self.log("没有找到期刊。")
-            self.issue_combo["values"] = []
-            self.issue_combo.configure(state=tk.DISABLED)
+            self.issue_combo.configure(state=tk.DISABLED, values=[])
             return
-        values = [f"{m.get('pageName', '')}（{m.get('date', '')}）|{m['id']}" for m in magazines]
-        self.issue_combo.configure(state="readonly")
-        self.issue_combo["values"] = values
+        # 下拉框只显示期名与日期，期刊 id 通过标签反查
+        self._issue_id_by_label = {}
+        for magazine in magazines:
+            label = f"{magazine.get('pageName', '')}（{magazine.get('date', '')}）"
+            if label in self._issue_id_by_label:
+                label = f"{label} [{magazine['id']}]"
+            self._issue_id_by_label[label] = magazine["id"]
+        self.issue_combo.configure(state="readonly", values=list(self._issue_id_by_label))
         self.issue_var.set("")
-        self.article_list.delete(0, tk.END)
+        self._clear_article_list()
         self.clear_content()
 
     def on_issue_selected(self, _event: tk.Event) -> None:  # type: ignore[override]
         selection = self.issue_var.get()
         if not selection:
             return
-        magazine_id = selection.split("|")[-1]
+        magazine_id = self._issue_id_by_label.get(selection)
+        if not magazine_id:
+            return
         self.current_magazine_id = magazine_id
         if magazine_id in self.articles_by_mag:
-            self.populate_articles(self.articles_by_mag[magazine_id])
+            self.populate_articles(magazine_id)
             return
 
         self.log("加载文章列表……")
-        self.article_list.delete(0, tk.END)
+        self._clear_article_list()
         self.clear_content()
 
         def worker() -> None:
             try:
-                articles = self.crawler.fetch_articles(magazine_id)  # type: ignore[union-attr]
+                articles = self._fetch_articles(magazine_id)
             except Exception as exc:  # pylint: disable=broad-except
                 self.after(0, self.on_issue_failed, exc)
                 return
             if not articles:
                 self.after(0, self.on_issue_failed, RuntimeError("该期刊暂无文章"))
                 return
-            self.articles_by_mag[magazine_id] = articles
-            self.after(0, self.populate_articles, articles)
+            self._register_articles(magazine_id, articles)
+            self.after(0, self.populate_articles, magazine_id)
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -358,19 +534,46 @@ class ChinaLandGUI(tk.Tk):
         self.log(f"加载文章失败：{exc}")
         messagebox.showerror("错误", f"加载文章失败：{exc}")
 
-    def populate_articles(self, articles: list[dict[str, Any]]) -> None:
+    def populate_articles(self, magazine_id: str) -> None:
+        # 重复选择当前期刊时列表已是最新，不再清空重建
+        if magazine_id == self._displayed_magazine_id:
+            return
         self.article_list.delete(0, tk.END)
-        for article in sorted(articles, key=lambda x: x.get("index") or 0):
-            index_raw = article.get("index")
-            try:
-                index_str = f"{int(index_raw):03d}"
-            except (TypeError, ValueError):
-                index_str = str(index_raw)
-            title = article.get("titleHtml") or article.get("title") or ""
-            title = normalise_whitespace(title)
-            self.article_list.insert(tk.END, f"{index_str} {title} | {article['id']}")
+        rows = self._article_rows.get(magazine_id)
+        if rows:
+            self.article_list.insert(tk.END, *rows)
+        # 行与 articles_by_mag 中已排序的文章同序生成，选中行号即可取得 id
+        self._listbox_ids = [article["id"] for article in self.articles_by_mag.get(magazine_id, [])]
         self.article_list.selection_clear(0, tk.END)
         self.clear_content()
+        self._displayed_magazine_id = magazine_id
+        self._start_prefetch(magazine_id)
+
+    def _clear_article_list(self) -> None:
+        self.article_list.delete(0, tk.END)
+        self._displayed_magazine_id = None
+        self._listbox_ids = []
+        self._prefetch_stop.set()
+
+    def _start_prefetch(self, magazine_id: str) -> None:
+        """后台按列表顺序预取当前期刊的文章详情，逐篇点开时可直接命中缓存。"""
+        self._prefetch_stop.set()
+        stop = self._prefetch_stop = threading.Event()
+        articles = self.articles_by_mag.get(magazine_id, [])
+
+        def worker() -> None:
+            # 单线程依次抓取，遵守爬虫的请求间隔
+            for article in articles:
+                if stop.is_set():
+                    return
+                if article["id"] in self.article_details:
+                    continue
+                try:
+                    self.get_article_detail(article["id"], base=article)
+                except Exception:  # pylint: disable=broad-except
+                    continue  # 预取失败不提示，用户点开时会重新请求并报告错误
+
+        threading.Thread(target=worker, name="cl-prefetch", daemon=True).start()
 
     # endregion
     # region article display
@@ -379,23 +582,34 @@ class ChinaLandGUI(tk.Tk):
         self.content_widget.delete("1.0", tk.END)
         self.content_widget.configure(state=tk.DISABLED)
 
+    def _register_articles(self, magazine_id: str, articles: list[dict[str, Any]]) -> None:
+        # 登记时排好序并生成列表框文本，之后切换期刊只需整体插入
+        articles.sort(key=article_sort_key)
+        rows = []
+        for article in articles:
+            # 与原先按期刊顺序线性查找一致：同一 id 以先登记的为准
+            self._article_index.setdefault(article["id"], article)
+            index_raw = article.get("index")
+            try:
+                index_str = f"{int(index_raw):03d}"
+            except (TypeError, ValueError):
+                index_str = str(index_raw)
+            title = normalise_whitespace(article.get("titleHtml") or article.get("title") or "")
+            rows.append(f"{index_str} {title} | {article['id']}")
+        self._article_rows[magazine_id] = rows
+        self.articles_by_mag[magazine_id] = articles
+
     def find_article_metadata(self, article_id: str) -> dict[str, Any] | None:
-        for articles in self.articles_by_mag.values():
-            for article in articles:
-                if article["id"] == article_id:
-                    return article
-        return None
+        return self._article_index.get(article_id)
 
     def on_article_selected(self, _event: tk.Event) -> None:  # type: ignore[override]
         if not self.article_list.curselection():
             return
-        selection = self.article_list.get(self.article_list.curselection()[0])
-        article_id = selection.split("|")[-1].strip()
+        article_id = self._listbox_ids[self.article_list.curselection()[0]]
         base = self.find_article_metadata(article_id)
-        if article_id in self.article_details:
-            detail = self.article_details[article_id]
-            if base:
-                detail = self.get_article_detail(article_id, base=base)
+        detail = self.article_details.get(article_id)
+        if detail is not None:
+            # 缓存中的详情在首次加载时已用列表字段补齐，无需再次合并
             self.display_article(detail)
             return
 
@@ -410,7 +624,7 @@ class ChinaLandGUI(tk.Tk):
             if not detail:
                 self.after(0, self.on_article_failed, RuntimeError("文章详情为空"))
                 return
-            self.after(0, self.display_article, detail)
+            self.after(0, self._show_content, self._format_article(detail))
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -418,56 +632,128 @@ class ChinaLandGUI(tk.Tk):
         self.log(f"加载文章详情失败：{exc}")
         messagebox.showerror("错误", f"加载文章详情失败：{exc}")
 
+    def _fetch_articles(self, magazine_id: str) -> list[dict[str, Any]]:
+        """优先读取本地缓存的文章列表，未命中再请求接口并写回缓存。"""
+        if self._cache is not None:
+            try:
+                cached = self._cache.get_articles(magazine_id)
+            except sqlite3.Error as exc:
+                self.log(f"读取缓存失败：{exc}")
+                cached = None
+            if cached:
+                return cached
+        articles = self.crawler.fetch_articles(magazine_id)  # type: ignore[union-attr]
+        if articles and self._cache is not None:
+            try:
+                self._cache.put_articles(magazine_id, articles)
+            except sqlite3.Error as exc:
+                self.log(f"写入缓存失败：{exc}")
+        return articles
+
+    def _fetch_magazines(self, year: str) -> list[dict[str, Any]]:
+        """同 _fetch_articles，缓存某一年的期刊列表。"""
+        if self._cache is not None:
+            try:
+                cached = self._cache.get_magazines(year)
+            except sqlite3.Error as exc:
+                self.log(f"读取缓存失败：{exc}")
+                cached = None
+            if cached:
+                return cached
+        magazines = self.crawler.fetch_magazines(year)  # type: ignore[union-attr]
+        if magazines and self._cache is not None:
+            try:
+                self._cache.put_magazines(year, magazines)
+            except sqlite3.Error as exc:
+                self.log(f"写入缓存失败：{exc}")
+        return magazines
+
+    def _fetch_article_detail(self, article_id: str) -> dict[str, Any]:
+        """同 _fetch_articles，缓存的是接口原始详情，补全字段仍在 get_article_detail 中完成。"""
+        if self._cache is not None:
+            try:
+                cached = self._cache.get_article_detail(article_id)
+            except sqlite3.Error as exc:
+                self.log(f"读取缓存失败：{exc}")
+                cached = None
+            if cached is not None:
+                return cached
+        detail = self.crawler.fetch_article_detail(article_id)  # type: ignore[union-attr]
+        if self._cache is not None:
+            try:
+                self._cache.put_article_detail(article_id, detail)
+            except sqlite3.Error as exc:
+                self.log(f"写入缓存失败：{exc}")
+        return detail
+
     def get_articles_for_magazine(self, magazine_id: str) -> list[dict[str, Any]]:
         if magazine_id in self.articles_by_mag:
             return self.articles_by_mag[magazine_id]
-        articles = self.crawler.fetch_articles(magazine_id)  # type: ignore[union-attr]
-        self.articles_by_mag[magazine_id] = articles
+        articles = self._fetch_articles(magazine_id)
+        self._register_articles(magazine_id, articles)
         return articles
 
-    def get_article_detail(self, article_id: str, base: dict[str, Any] | None = None) -> dict[str, Any]:
+    def get_article_detail(
+        self, article_id: str, base: dict[str, Any] | None = None, remember: bool = True
+    ) -> dict[str, Any]:
+        """取文章详情；remember 为 False 时不写入 article_details（批量导出用，避免详情常驻内存）。"""
         if article_id in self.article_details:
-            detail = self.article_details[article_id].copy()
-            if base:
-                detail.setdefault("index", base.get("index"))
-                for key in ("title", "titleHtml", "author", "authorHtml", "column", "text", "pageNumber"):
-                    if key not in detail and key in base:
-                        detail[key] = base[key]
-            return detail
-        detail = self.crawler.fetch_article_detail(article_id)  # type: ignore[union-attr]
+            detail = self.article_details[article_id]
+            return _enrich_detail(detail, base, _ENRICH_KEYS_SHORT) if base else detail.copy()
+        # 同一篇文章可能同时被预览和导出线程请求：只由第一个调用方抓取，其余等待其结果
+        with self._inflight_lock:
+            # 锁内再查一次：上一个抓取方可能刚写入结果并移除了 in-flight 记录
+            detail = self.article_details.get(article_id)
+            pending = None if detail is not None else self._inflight.get(article_id)
+            if detail is None and pending is None:
+                future: concurrent.futures.Future[dict[str, Any]] = concurrent.futures.Future()
+                self._inflight[article_id] = future
+        if detail is not None:
+            return _enrich_detail(detail, base, _ENRICH_KEYS_SHORT) if base else detail.copy()
+        if pending is not None:
+            # 抓取失败时把同一异常抛给等待方；抓取方可能未缓存详情，直接使用其结果
+            detail = pending.result()
+            return _enrich_detail(detail, base, _ENRICH_KEYS) if base else detail.copy()
+        try:
+            detail = self._load_article_detail(article_id, base, remember)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(detail)
+            if not remember:
+                detail = detail.copy()  # 调用方会改写返回值，不影响交给等待方的结果
+        finally:
+            with self._inflight_lock:
+                del self._inflight[article_id]
+        return detail
+
+    def _load_article_detail(self, article_id: str, base: dict[str, Any] | None, remember: bool) -> dict[str, Any]:
+        detail = self._fetch_article_detail(article_id)
         if base:
-            enriched = detail.copy()
-            enriched.setdefault("index", base.get("index"))
-            for key in (
-                "title",
-                "titleHtml",
-                "author",
-                "authorHtml",
-                "column",
-                "text",
-                "pageNumber",
-                "coverImgPath",
-            ):
-                if key not in enriched and key in base:
-                    enriched[key] = base[key]
-            detail = enriched
-        self.article_details[article_id] = detail
+            detail = _enrich_detail(detail, base, _ENRICH_KEYS)
+        if remember:
+            self.article_details[article_id] = detail
         return detail
 
     def display_article(self, detail: dict[str, Any]) -> None:
+        self._show_content(self._format_article(detail))
+
+    @staticmethod
+    def _format_article(detail: dict[str, Any]) -> str:
+        """生成预览文本；不涉及 Tk，可在工作线程中完成 HTML 解析。"""
         title = normalise_whitespace(detail.get("titleHtml") or detail.get("title") or "")
         author = normalise_whitespace(detail.get("authorHtml") or detail.get("author") or "")
         column = normalise_whitespace(detail.get("column") or "")
-        body = normalise_whitespace(detail.get("html") or "") or normalise_whitespace(detail.get("text") or "")
-        images = extract_images(detail.get("html"))
-        meta = []
+        # 正文与图片一次解析得到；clean_html 的结果不会含连续三个换行，与 normalise_whitespace 等价
+        body, images = parse_article_html(detail.get("html"))
+        body = body or normalise_whitespace(detail.get("text") or "")
+        content_parts = [title, ""]
         if column:
-            meta.append(f"栏目：{column}")
+            content_parts.append(f"栏目：{column}")
         if author:
-            meta.append(f"作者：{author}")
-        content_parts = [title, ""]
-        if meta:
-            content_parts.append("\n".join(meta))
+            content_parts.append(f"作者：{author}")
+        if column or author:
             content_parts.append("")
         if images:
             for idx, image in enumerate(images, start=1):
@@ -475,7 +761,9 @@ class ChinaLandGUI(tk.Tk):
                 content_parts.append(f"![{caption}]({image['url']})")
             content_parts.append("")
         content_parts.append(body)
-        content = "\n".join(part for part in content_parts if part is not None)
+        return "\n".join(content_parts)
+
+    def _show_content(self, content: str) -> None:
         self.content_widget.configure(state=tk.NORMAL)
         self.content_widget.delete("1.0", tk.END)
         self.content_widget.insert(tk.END, content)
@@ -503,28 +791,110 @@ class ChinaLandGUI(tk.Tk):
     def get_magazines_for_year(self, year: str) -> list[dict[str, Any]]:
         if year in self.magazines_by_year:
             return self.magazines_by_year[year]
-        magazines = self.crawler.fetch_magazines(year)  # type: ignore[union-attr]
+        magazines = self._fetch_magazines(year)
         self.magazines_by_year[year] = magazines
         return magazines
 
     def collect_issue_payload(
-        self, magazine: dict[str, Any], need_detail: bool = True
+        self,
+        magazine: dict[str, Any],
+        need_detail: bool = True,
+        cancel_event: threading.Event | None = None,
     ) -> list[dict[str, Any]]:
+        """cancel_event 置位后不再等待剩余详情，撤销排队中的请求并返回已取得的部分。"""
         articles = self.get_articles_for_magazine(magazine["id"])
-        result: List[Dict[str, Any]] = []
+        bases: List[Dict[str, Any]] = []
         for article in articles:
             base = article.copy()
             base["magazine_id"] = magazine["id"]
             base["magazine_meta"] = magazine
-            if need_detail:
-                detail = self.get_article_detail(article["id"], base=base)
+            bases.append(base)
+        if not need_detail:
+            return bases
+        # 详情请求并发提交到共享线程池，按原文章顺序收集结果；批量导出的详情不留在 article_details 中
+        futures = [self._io_pool.submit(self.get_article_detail, base["id"], base, remember=False) for base in bases]
+        result: List[Dict[str, Any]] = []
+        try:
+            for future in futures:
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                detail = future.result()
                 detail["magazine_id"] = magazine["id"]
                 detail["magazine_meta"] = magazine
                 result.append(detail)
-            else:
-                result.append(base)
+        finally:
+            self._cancel_futures(futures)
         return result
 
+    def _get_export_detail(self, year: str, magazine: dict[str, Any], article: dict[str, Any]) -> dict[str, Any]:
+        # 年度 / 全量导出按 magazine_id 与 year 把文章归入各期；详情不留在 article_details 中，
+        # 重复导出时由 SQLite 缓存命中
+        detail = self.get_article_detail(article["id"], base=article, remember=False)
+        detail["magazine_id"] = magazine["id"]
+        detail["magazine_meta"] = magazine
+        detail["year"] = year
+        return detail
+
+    def _iter_export_tasks(
+        self,
+        issues: Iterable[Tuple[str, Dict[str, Any]]],
+        cancel_event: threading.Event,
+        pause_event: threading.Event,
+        count_progress: bool,
+    ) -> Iterator[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        # 按需取各期文章列表，逐篇产出 (年份, 期刊, 文章)
+        for year, mag in issues:
+            if cancel_event.is_set():
+                return
+            pause_event.wait()
+            mag_articles = self.get_articles_for_magazine(mag["id"])
+            if count_progress:
+                self._queue_progress_total(len(mag_articles))
+            for art in mag_articles:
+                yield year, mag, art
+
+    def _iter_detail_futures(
+        self,
+        issues: Iterable[Tuple[str, Dict[str, Any]]],
+        cancel_event: threading.Event,
+        pause_event: threading.Event,
+        count_progress: bool = False,
+    ) -> Iterator[Tuple[Dict[str, Any], concurrent.futures.Future]]:
+        """跨期提交详情请求并按完成顺序产出 (期刊, future)，各期之间不再相互等待。
+
+        同时挂在线程池上的请求不超过线程数的 EXPORT_INFLIGHT_PER_WORKER 倍，
+        取走一个结果才补交下一个；详情不写入 article_details，因此排队中的详情数量与导出规模无关。
+        count_progress 为 True 时，每取得一期的文章列表就把篇数计入进度总数。
+        """
+        executor = self._io_pool
+        limit = max(1, self._io_pool_size) * EXPORT_INFLIGHT_PER_WORKER
+        tasks = self._iter_export_tasks(issues, cancel_event, pause_event, count_progress)
+        pending: Dict[concurrent.futures.Future, Dict[str, Any]] = {}
+        try:
+            while True:
+                for year, mag, art in tasks:
+                    pending[executor.submit(self._get_export_detail, year, mag, art)] = mag
+                    if len(pending) >= limit:
+                        break
+                if not pending:
+                    return
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    if cancel_event.is_set():
+                        return
+                    if not pause_event.is_set():  # 未暂停时只读标志位，不必获取 Event 内部的锁
+                        pause_event.wait()
+                    yield pending.pop(future), future
+        finally:
+            # 取消、出错或调用方提前结束时，丢弃尚未开始的请求
+            self._cancel_futures(pending)
+
+    @staticmethod
+    def _cancel_futures(futures: Iterable[concurrent.futures.Future]) -> None:
+        """撤销仍在共享线程池中排队的请求；已在执行或已完成的不受影响。"""
+        for future in futures:
+            future.cancel()
+
     def get_mode_key(self) -> str:
         mode_map = {
             "按文章 (每个MD)": "per_article",
@@ -549,20 +919,21 @@ class ChinaLandGUI(tk.Tk):
             messagebox.showwarning("警告", "已有导出任务进行中，请等待完成或取消。")
             return
         self.is_exporting = True
-        self.cancel_flag = False
+        self._cancel_event = threading.Event()
         self.pause_event = threading.Event()
         self.pause_event.set()  # Initially resumed
         self.pause_button.configure(text="暂停", state="normal")
         self.cancel_button.configure(state="normal")
         self.disable_export_controls(True)
+        self._refresh_io_pool()
+        self._ensure_progress_drain()
         threading.Thread(target=func, daemon=True).start()
 
     def export_selected_article(self) -> None:
         if not self.article_list.curselection():
             messagebox.showinfo("提示", "请先选择文章。")
             return
-        selection = self.article_list.get(self.article_list.curselection()[0])
-        article_id = selection.split("|")[-1].strip()
+        article_id = self._listbox_ids[self.article_list.curselection()[0]]
         base = self.find_article_metadata(article_id)
         try:
             detail = self.get_article_detail(article_id, base=base)
@@ -601,6 +972,27 @@ class ChinaLandGUI(tk.Tk):
         self.is_exporting = False  # Single, no need for controls
         self.disable_export_controls(False)
 
+    def _start_article_writer(
+        self, output_dir: Path, prefix: str
+    ) -> Tuple[queue.SimpleQueue[Tuple[Dict[str, Any], Dict[str, Any]] | None], threading.Thread]:
+        """启动单篇文章的写出线程：渲染与写盘不再占用收取抓取结果的循环，放入 None 表示结束。"""
+        writer_queue: queue.SimpleQueue[Tuple[Dict[str, Any], Dict[str, Any]] | None] = queue.SimpleQueue()
+
+        def drain() -> None:
+            while True:
+                item = writer_queue.get()
+                if item is None:
+                    return
+                detail, magazine = item
+                try:
+                    write_article_separately(detail, magazine, output_dir, prefix)
+                except Exception as exc:  # pylint: disable=broad-except
+                    self.log(f"写入文章失败：{exc}")
+
+        writer = threading.Thread(target=drain, name="cl-writer", daemon=True)
+        writer.start()
+        return writer_queue, writer
+
     def export_selected_issue(self) -> None:
         magazine = self.get_current_magazine()
         if not magazine:
@@ -620,65 +1012,73 @@ class ChinaLandGUI(tk.Tk):
             messagebox.showinfo("提示", "该期刊暂无文章。")
             return
         issue_name = magazine.get("pageName") or magazine["id"]
+        article_label = f"导出期刊文章：{issue_name}"
+        issue_label = f"导出期刊：{issue_name}"
 
         def worker_func() -> None:
             try:
                 pause_event = self.pause_event
-                cancel_flag = self.cancel_flag
+                cancel_event = self._cancel_event
+                executor = self._io_pool
                 if mode == "per_article":
-                    self.after(0, self.start_progress, len(articles), f"导出期刊文章：{issue_name}")
-                    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                        future_to_art = {executor.submit(self.get_article_detail, art["id"], art): art for art in articles}
-                        completed = 0
+                    self.after(0, self.start_progress, len(articles), article_label)
+                    future_to_art = {executor.submit(self.get_article_detail, art["id"], art): art for art in articles}
+                    writer_queue, writer = self._start_article_writer(output_dir, prefix)
+                    try:
                         for future in concurrent.futures.as_completed(future_to_art):
-                            if cancel_flag:
+                            if cancel_event.is_set():
+                                self._cancel_futures(future_to_art)
                                 break
-                            pause_event.wait()
+                            if not pause_event.is_set():
+                                pause_event.wait()
                             try:
                                 detail = future.result()
                                 art = future_to_art[future]
                                 art["magazine_meta"] = magazine
                                 detail["magazine_id"] = magazine["id"]
                                 detail["magazine_meta"] = magazine
-                                write_article_separately(detail, magazine, output_dir, prefix)
-                                completed += 1
-                                self.after(0, lambda: self.update_progress(1, f"导出期刊文章：{issue_name}"))
+                                writer_queue.put((detail, magazine))
                             except Exception as exc:
                                 self.log(f"文章详情失败：{exc}")
-                                completed += 1
-                                self.after(0, lambda: self.update_progress(1, f"导出期刊文章：{issue_name}"))
+                            self._queue_progress(1, article_label)
+                    finally:
+                        writer_queue.put(None)
+                        writer.join()
                 else:
-                    self.after(0, self.start_progress, len(articles), f"导出期刊：{issue_name}")
+                    self.after(0, self.start_progress, len(articles), issue_label)
                     issue_articles = []
-                    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                        future_to_base = {executor.submit(self.get_article_detail, art["id"], art): art for art in articles}
-                        for future in concurrent.futures.as_completed(future_to_base):
-                            if cancel_flag:
-                                break
+                    future_to_base = {executor.submit(self.get_article_detail, art["id"], art): art for art in articles}
+                    for future in concurrent.futures.as_completed(future_to_base):
+                        if cancel_event.is_set():
+                            self._cancel_futures(future_to_base)
+                            break
+                        if not pause_event.is_set():
                             pause_event.wait()
-                            try:
-                                detail = future.result()
-                                issue_articles.append(detail)
-                                self.after(0, lambda: self.update_progress(1, f"导出期刊：{issue_name}"))
-                            except Exception as exc:
-                                self.log(f"文章详情失败：{exc}")
-                                self.after(0, lambda: self.update_progress(1, f"导出期刊：{issue_name}"))
-                    write_issue_markdown(
-                        magazine,
-                        sorted(issue_articles, key=lambda x: x.get("index") or 0),
-                        output_dir,
-                        prefix,
-                        fallback_name=magazine["id"],
-                    )
-                if not cancel_flag:
+                        try:
+                            detail = future.result()
+                            issue_articles.append(detail)
+                            self._queue_progress(1, issue_label)
+                        except Exception as exc:
+                            self.log(f"文章详情失败：{exc}")
+                            self._queue_progress(1, issue_label)
+                    # 取消后不写出残缺的期刊文件
+                    if not cancel_event.is_set():
+                        write_issue_markdown(
+                            magazine,
+                            sorted(issue_articles, key=article_sort_key),
+                            output_dir,
+                            prefix,
+                            fallback_name=magazine["id"],
+                        )
+                if not cancel_event.is_set():
                     self.after(0, self.export_success, f"已导出期刊至 {output_dir}")
                 else:
-                    self.after(0, self._finish_cancel)
+                    self.after(0, self._finish_cancel, cancel_event)
             except Exception as exc:
-                if not cancel_flag:
+                if not cancel_event.is_set():
                     self.after(0, self.export_failed, exc)
                 else:
-                    self.after(0, self._finish_cancel)
+                    self.after(0, self._finish_cancel, cancel_event)
 
         self._start_export(worker_func)
 
@@ -696,6 +1096,8 @@ class ChinaLandGUI(tk.Tk):
         year = self.current_year
         mode = self.get_mode_key()
         self.log(f"导出 {year} 年（模式：{mode}）……")
+        article_label = f"导出 {year} 年文章"
+        year_label = f"导出 {year} 年"
         magazines = self.get_magazines_for_year(year)
         if not magazines:
             messagebox.showinfo("提示", f"{year} 年暂无期刊。")
@@ -704,82 +1106,58 @@ class ChinaLandGUI(tk.Tk):
         def worker_func() -> None:
             try:
                 pause_event = self.pause_event
-                cancel_flag = self.cancel_flag
-                all_articles: List[Dict[str, Any]] = []
-                total_items = 0
+                cancel_event = self._cancel_event
+                issues = [(year, mag) for mag in magazines]
                 if mode == "per_article":
-                    # Pre-count articles
-                    for mag in magazines:
-                        mag_articles = self.get_articles_for_magazine(mag["id"])
-                        total_items += len(mag_articles)
-                    self.after(0, self.start_progress, total_items, f"导出 {year} 年文章")
-                    for mag in magazines:
-                        if cancel_flag:
-                            break
-                        pause_event.wait()
-                        mag_articles = self.get_articles_for_magazine(mag["id"])
-                        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                            future_to_art = {executor.submit(self.get_article_detail, art["id"], art): art for art in mag_articles}
-                            for future in concurrent.futures.as_completed(future_to_art):
-                                if cancel_flag:
-                                    break
-                                pause_event.wait()
-                                try:
-                                    detail = future.result()
-                                    art = future_to_art[future]
-                                    art["magazine_meta"] = mag
-                                    write_article_separately(detail, mag, output_dir, prefix)
-                                    self.after(0, self.update_progress, 1, f"导出 {year} 年文章")
-                                except Exception as exc:
-                                    self.log(f"文章详情失败：{exc}")
-                                    self.after(0, self.update_progress, 1, f"导出 {year} 年文章")
+                    self.after(0, self.start_progress, 0, article_label)
+                    writer_queue, writer = self._start_article_writer(output_dir, prefix)
+                    try:
+                        for mag, future in self._iter_detail_futures(issues, cancel_event, pause_event, True):
+                            try:
+                                writer_queue.put((future.result(), mag))
+                            except Exception as exc:
+                                self.log(f"文章详情失败：{exc}")
+                            self._queue_progress(1, article_label)
+                    finally:
+                        writer_queue.put(None)
+                        writer.join()
                 elif mode in ["per_year", "all_in_one"]:
-                    # Collect all
-                    for mag in magazines:
-                        if cancel_flag:
-                            break
-                        pause_event.wait()
-                        mag_articles_base = self.get_articles_for_magazine(mag["id"])
-                        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                            future_to_base = {executor.submit(self.get_article_detail, art["id"], art): art for art in mag_articles_base}
-                            mag_articles = []
-                            for future in concurrent.futures.as_completed(future_to_base):
-                                if cancel_flag:
-                                    break
-                                pause_event.wait()
-                                try:
-                                    detail = future.result()
-                                    mag_articles.append(detail)
-                                    self.after(0, self.update_progress, 1, f"导出 {year} 年")
-                                except Exception as exc:
-                                    self.log(f"文章详情失败：{exc}")
-                                    self.after(0, self.update_progress, 1, f"导出 {year} 年")
-                        all_articles.extend(mag_articles)
-                    write_year_markdown(year, magazines, all_articles, output_dir, prefix)
+                    self.after(0, self.start_progress, 0, year_label)
+                    all_articles: List[Dict[str, Any]] = []
+                    for _mag, future in self._iter_detail_futures(issues, cancel_event, pause_event, True):
+                        try:
+                            all_articles.append(future.result())
+                        except Exception as exc:
+                            self.log(f"文章详情失败：{exc}")
+                        self._queue_progress(1, year_label)
+                    if not cancel_event.is_set():
+                        write_year_markdown(year, magazines, all_articles, output_dir, prefix)
                 else:  # per_issue
-                    self.after(0, self.start_progress, len(magazines), f"导出 {year} 年")
+                    self.after(0, self.start_progress, len(magazines), year_label)
                     for mag in magazines:
-                        if cancel_flag:
+                        if cancel_event.is_set():
                             break
                         pause_event.wait()
-                        issue_articles = self.collect_issue_payload(mag)
+                        issue_articles = self.collect_issue_payload(mag, cancel_event=cancel_event)
+                        if cancel_event.is_set():
+                            break
                         write_issue_markdown(
                             mag,
-                            sorted(issue_articles, key=lambda x: x.get("index") or 0),
+                            sorted(issue_articles, key=article_sort_key),
                             output_dir,
                             prefix,
                             fallback_name=mag["id"],
                         )
-                        self.after(0, self.update_progress, 1, f"导出 {year} 年")
-                if not cancel_flag:
+                        self._queue_progress(1, year_label)
+                if not cancel_event.is_set():
                     self.after(0, self.export_success, f"{year} 年导出完成。")
                 else:
-                    self.after(0, self._finish_cancel)
+                    self.after(0, self._finish_cancel, cancel_event)
             except Exception as exc:
-                if not cancel_flag:
+                if not cancel_event.is_set():
                     self.after(0, self.export_failed, exc)
                 else:
-                    self.after(0, self._finish_cancel)
+                    self.after(0, self._finish_cancel, cancel_event)
 
         self._start_export(worker_func)
 
@@ -801,132 +1179,100 @@ class ChinaLandGUI(tk.Tk):
         def worker_func() -> None:
             try:
                 pause_event = self.pause_event
-                cancel_flag = self.cancel_flag
-                year_magazines: List[Tuple[str, List[Dict[str, Any]]]] = []
-                all_articles: List[Dict[str, Any]] = []
-                total_items = 0
+                cancel_event = self._cancel_event
                 if mode == "per_article":
-                    # Pre-count
-                    for year in years:
-                        magazines = self.get_magazines_for_year(year)
-                        for mag in magazines:
-                            mag_articles = self.get_articles_for_magazine(mag["id"])
-                            total_items += len(mag_articles)
-                    self.after(0, self.start_progress, total_items, "全量导出文章")
-                    for year in years:
-                        if cancel_flag:
-                            break
-                        pause_event.wait()
-                        magazines = self.get_magazines_for_year(year)
-                        for mag in magazines:
-                            if cancel_flag:
-                                break
-                            pause_event.wait()
-                            mag_articles = self.get_articles_for_magazine(mag["id"])
-                            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                                future_to_art = {executor.submit(self.get_article_detail, art["id"], art): art for art in mag_articles}
-                                for future in concurrent.futures.as_completed(future_to_art):
-                                    if cancel_flag:
-                                        break
-                                    pause_event.wait()
-                                    try:
-                                        detail = future.result()
-                                        art = future_to_art[future]
-                                        art["magazine_meta"] = mag
-                                        write_article_separately(detail, mag, output_dir, prefix)
-                                        self.after(0, self.update_progress, 1, "全量导出文章")
-                                    except Exception as exc:
-                                        self.log(f"文章详情失败：{exc}")
-                                        self.after(0, self.update_progress, 1, "全量导出文章")
+                    # 逐年取期刊列表，边枚举边提交
+                    issues = ((year, mag) for year in years for mag in self.get_magazines_for_year(year))
+                    self.after(0, self.start_progress, 0, "全量导出文章")
+                    writer_queue, writer = self._start_article_writer(output_dir, prefix)
+                    try:
+                        for mag, future in self._iter_detail_futures(issues, cancel_event, pause_event, True):
+                            try:
+                                writer_queue.put((future.result(), mag))
+                            except Exception as exc:
+                                self.log(f"文章详情失败：{exc}")
+                            self._queue_progress(1, "全量导出文章")
+                    finally:
+                        writer_queue.put(None)
+                        writer.join()
                 elif mode == "all_in_one":
-                    for year in years:
-                        if cancel_flag:
-                            break
-                        pause_event.wait()
-                        magazines = self.get_magazines_for_year(year)
-                        year_magazines.append((year, magazines))
-                        year_all_articles = []
-                        for mag in magazines:
-                            if cancel_flag:
-                                break
+                    self.after(0, self.start_progress, 0, "全量导出")
+
+                    def year_sections() -> Iterator[Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]]]]:
+                        # 写完一年再抓取下一年，内存中只保留当年的文章
+                        for year in years:
+                            if cancel_event.is_set():
+                                raise _ExportCancelled
                             pause_event.wait()
-                            mag_articles_base = self.get_articles_for_magazine(mag["id"])
-                            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                                future_to_base = {executor.submit(self.get_article_detail, art["id"], art): art for art in mag_articles_base}
-                                for future in concurrent.futures.as_completed(future_to_base):
-                                    if cancel_flag:
-                                        break
-                                    pause_event.wait()
-                                    try:
-                                        detail = future.result()
-                                        year_all_articles.append(detail)
-                                        self.after(0, self.update_progress, 1, "全量导出")
-                                    except Exception as exc:
-                                        self.log(f"文章详情失败：{exc}")
-                                        self.after(0, self.update_progress, 1, "全量导出")
-                        all_articles.extend(year_all_articles)
-                    write_all_markdown(years, year_magazines, all_articles, output_dir, prefix)
+                            magazines = self.get_magazines_for_year(year)
+                            year_articles: List[Dict[str, Any]] = []
+                            issues = [(year, mag) for mag in magazines]
+                            for _mag, future in self._iter_detail_futures(issues, cancel_event, pause_event, True):
+                                try:
+                                    year_articles.append(future.result())
+                                except Exception as exc:
+                                    self.log(f"文章详情失败：{exc}")
+                                self._queue_progress(1, "全量导出")
+                            if cancel_event.is_set():
+                                raise _ExportCancelled
+                            yield year, magazines, year_articles
+
+                    try:
+                        write_all_markdown_sections(year_sections(), output_dir, prefix)
+                    except _ExportCancelled:
+                        pass  # 写出函数已删除未完成的临时文件
                 elif mode == "per_year":
                     total_years = len(years)
                     self.after(0, self.start_progress, total_years, "全量导出（按年）")
                     for year in years:
-                        if cancel_flag:
+                        if cancel_event.is_set():
                             break
                         pause_event.wait()
                         magazines = self.get_magazines_for_year(year)
                         year_all_articles: List[Dict[str, Any]] = []
-                        for mag in magazines:
-                            if cancel_flag:
-                                break
-                            pause_event.wait()
-                            mag_articles_base = self.get_articles_for_magazine(mag["id"])
-                            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                                future_to_base = {executor.submit(self.get_article_detail, art["id"], art): art for art in mag_articles_base}
-                                for future in concurrent.futures.as_completed(future_to_base):
-                                    if cancel_flag:
-                                        break
-                                    pause_event.wait()
-                                    try:
-                                        detail = future.result()
-                                        year_all_articles.append(detail)
-                                    except Exception as exc:
-                                        self.log(f"文章详情失败：{exc}")
+                        issues = [(year, mag) for mag in magazines]
+                        for _mag, future in self._iter_detail_futures(issues, cancel_event, pause_event):
+                            try:
+                                year_all_articles.append(future.result())
+                            except Exception as exc:
+                                self.log(f"文章详情失败：{exc}")
+                        if cancel_event.is_set():
+                            break
                         write_year_markdown(year, magazines, year_all_articles, output_dir, prefix)
-                        self.after(0, self.update_progress, 1, "全量导出（按年）")
+                        self._queue_progress(1, "全量导出（按年）")
                 else:  # per_issue
-                    total_magazines = 0
-                    for year in years:
-                        magazines = self.get_magazines_for_year(year)
-                        total_magazines += len(magazines)
-                    self.after(0, self.start_progress, total_magazines, "全量导出")
+                    self.after(0, self.start_progress, 0, "全量导出")
                     for year in years:
-                        if cancel_flag:
+                        if cancel_event.is_set():
                             break
                         pause_event.wait()
                         magazines = self.get_magazines_for_year(year)
+                        self._queue_progress_total(len(magazines))
                         for mag in magazines:
-                            if cancel_flag:
+                            if cancel_event.is_set():
                                 break
                             pause_event.wait()
-                            issue_articles = self.collect_issue_payload(mag)
+                            issue_articles = self.collect_issue_payload(mag, cancel_event=cancel_event)
+                            if cancel_event.is_set():
+                                break
                             write_issue_markdown(
                                 mag,
-                                sorted(issue_articles, key=lambda x: x.get("index") or 0),
+                                sorted(issue_articles, key=article_sort_key),
                                 output_dir,
                                 prefix,
                                 fallback_name=mag["id"],
                             )
-                            self.after(0, self.update_progress, 1, "全量导出")
+                            self._queue_progress(1, "全量导出")
                         self.log(f"{year} 年导出完成。")
-                if not cancel_flag:
+                if not cancel_event.is_set():
                     self.after(0, self.export_success, "全量导出完成。")
                 else:
-                    self.after(0, self._finish_cancel)
+                    self.after(0, self._finish_cancel, cancel_event)
             except Exception as exc:
-                if not cancel_flag:
+                if not cancel_event.is_set():
                     self.after(0, self.export_failed, exc)
                 else:
-                    self.after(0, self._finish_cancel)
+                    self.after(0, self._finish_cancel, cancel_event)
 
         self._start_export(worker_func)
 